@@ -1,9 +1,16 @@
 import socket 
 import threading
 
-# Variável global para sinalizar o encerramento da conexão.
-# Usada para interromper o loop principal e a thread de recebimento de mensagens.
-encerrar_conexao = False  
+# Evento global para sinalizar o encerramento da conexão.
+# Usado para interromper o loop principal e a thread de recebimento de mensagens.
+encerrar_conexao = threading.Event()
+
+# Desativa o algoritmo de Nagle no socket do cliente, evitando atrasos no envio
+# das mensagens curtas do jogo (comandos e palpites).
+TCP_NODELAY_ENABLED = True
+
+# Tamanho, em bytes, dos buffers de envio e recebimento (SO_SNDBUF/SO_RCVBUF) do socket.
+TAMANHO_BUFFER_SOCKET = 65536
 
 def criar_socket():
     """
@@ -12,7 +19,12 @@ def criar_socket():
     Returns:
         socket.socket: Um novo objeto socket configurado para IPv4 e TCP.
     """
-    return socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    cliente_socket = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
+    if TCP_NODELAY_ENABLED:
+        cliente_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Envia cada mensagem imediatamente.
+    cliente_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, TAMANHO_BUFFER_SOCKET)
+    cliente_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, TAMANHO_BUFFER_SOCKET)
+    return cliente_socket
 
 def conectar_servidor(cliente_socket, host, port):
     """
@@ -37,26 +49,33 @@ def receber_mensagens(cliente_socket):
     """
     Thread responsável por receber mensagens do servidor.
 
+    Cada mensagem do servidor é uma linha terminada em '\n'.
+
     Args:
         cliente_socket (socket.socket): O socket do cliente.
     """
-    global encerrar_conexao
-    while not encerrar_conexao:
+    rfile = cliente_socket.makefile('rb', buffering=8192)  # Leitura bufferizada, linha a linha.
+    while not encerrar_conexao.is_set():
         try:
-            resposta = cliente_socket.recv(1024).decode()  # Recebe a resposta do servidor.
-            if not resposta or resposta.upper() == "/DESCONECTAR":
-                # Verifica se o servidor solicitou desconexão.
-                print("Servidor solicitou desconexão.")
-                encerrar_conexao = True  # Sinaliza para encerrar o loop no cliente.
+            linha = rfile.readline()  # Recebe a próxima mensagem do servidor.
+            resposta = linha.decode('utf-8', 'replace').rstrip('\r\n')
+            # O servidor sempre envia o comando em maiúsculas, dispensando upper() a cada linha.
+            if not linha or resposta == "/DESCONECTAR":
+                # Verifica se o servidor solicitou desconexão (e não o próprio cliente, ao fechar o socket).
+                if not encerrar_conexao.is_set():
+                    print("Servidor solicitou desconexão.")
+                encerrar_conexao.set()  # Sinaliza para encerrar o loop no cliente.
                 break
+            if not resposta:
+                continue  # Ignora linhas vazias (ex.: final do ranking).
             print(f"Servidor: {resposta}")  # Exibe a mensagem recebida do servidor.
         except ConnectionResetError:
             # Caso a conexão seja encerrada abruptamente pelo servidor.
             print("Conexão com o servidor encerrada.")
-            encerrar_conexao = True
+            encerrar_conexao.set()
             break
         except Exception as e:
-            if not encerrar_conexao:
+            if not encerrar_conexao.is_set():
                 print(f"Erro ao receber mensagem: {e}")
             break
 
@@ -78,18 +97,21 @@ def enviar_mensagens(cliente_socket):
     """
     Loop principal que envia mensagens digitadas pelo usuário ao servidor.
 
+    Cada mensagem é enviada como uma linha terminada em '\n'.
+
     Args:
         cliente_socket (socket.socket): O socket do cliente.
     """
-    global encerrar_conexao
-    while not encerrar_conexao:
+    wfile = cliente_socket.makefile('wb', buffering=8192)  # Escrita bufferizada.
+    while not encerrar_conexao.is_set():
         mensagem = input()  # Aguarda a mensagem do usuário.
-        if mensagem.upper() == "/DESCONECTAR":
+        wfile.write(mensagem.encode() + b'\n')  # Escreve a mensagem terminada em '\n'.
+        wfile.flush()  # Envia a mensagem ao servidor.
+        # Só converte para maiúsculas mensagens que podem ser comandos, não palpites.
+        if mensagem.startswith("/") and mensagem.upper() == "/DESCONECTAR":
             # O usuário solicitou desconexão.
-            encerrar_conexao = True  # Sinaliza para encerrar a conexão.
-            cliente_socket.sendall(mensagem.encode())  # Envia o comando de desconexão ao servidor.
+            encerrar_conexao.set()  # Sinaliza para encerrar a conexão.
             break
-        cliente_socket.sendall(mensagem.encode())  # Envia a mensagem ao servidor.
 
 def fechar_socket(cliente_socket):
     """
@@ -98,10 +120,10 @@ def fechar_socket(cliente_socket):
     Args:
         cliente_socket (socket.socket): O socket do cliente.
     """
-    global encerrar_conexao
-    encerrar_conexao = True  # Garante que o loop e a thread sejam finalizados.
+    encerrar_conexao.set()  # Garante que o loop e a thread sejam finalizados.
     try:
-        cliente_socket.shutdown(socket.SHUT_RDWR)  # Encerra a leitura e escrita do socket.
+        # Encerra a leitura e escrita do socket, desbloqueando a thread de recebimento.
+        cliente_socket.shutdown(socket.SHUT_RDWR)
     except Exception as e:
         print(f"Erro ao tentar encerrar o socket: {e}")
     finally:
@@ -131,7 +153,7 @@ def start_client(host='localhost', port=12345):
     except KeyboardInterrupt:
         # Trata interrupções do teclado (Ctrl+C).
         print("\nFechando conexão.")
-        encerrar_conexao = True
+        encerrar_conexao.set()
     except Exception as e:
         print(f"Ocorreu um erro: {e}")
     finally:
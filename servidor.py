@@ -1,95 +1,323 @@
+import os
+import errno
 import socket
-import threading
+import selectors
 import random
+from collections import Counter
+
+try:
+    import resource
+except ImportError:
+    resource = None  # Indisponível no Windows; vale apenas MAX_CONEXOES.
+
+# Desativa o algoritmo de Nagle nos sockets dos clientes. As mensagens do jogo são
+# pequenas e interativas, então não faz sentido esperar para agrupá-las em pacotes maiores.
+TCP_NODELAY_ENABLED = True
+
+# Tamanho, em bytes, dos buffers de envio e recebimento (SO_SNDBUF/SO_RCVBUF) dos
+# sockets dos clientes. Comporta rajadas de anúncios e rankings com muitos jogadores.
+# É aplicado ao socket de escuta, antes de listen(), para que as conexões aceitas o herdem
+# desde o handshake TCP.
+TAMANHO_BUFFER_SOCKET = 65536
+
+# Limite, em bytes, de mensagens pendentes de envio para um mesmo cliente. Um cliente que
+# não lê suas mensagens e ultrapassa esse limite é desconectado.
+MAX_SAIDA_PENDENTE = 1024 * 1024
+
+# Tamanho da fila de conexões pendentes do socket de escuta.
+BACKLOG_CONEXOES = 128
+
+# Número máximo de clientes conectados ao mesmo tempo. Conexões além desse limite
+# são recusadas logo após serem aceitas.
+MAX_CONEXOES = 1000
+
+# Descritores de arquivo reservados para o próprio servidor (entrada/saída padrão, socket de
+# escuta, seletor), descontados do limite do processo ao calcular o limite de clientes.
+DESCRITORES_RESERVADOS = 16
+
+# Quantidade máxima de bytes lidos de um cliente a cada evento de leitura.
+TAMANHO_LEITURA = 4096
+
+# Tamanho máximo, em bytes, de uma mensagem do cliente (sem o '\n'). Um cliente que envia uma
+# mensagem maior é desconectado, evitando que o buffer de leitura cresça sem limite.
+MAX_TAMANHO_MENSAGEM = 1024
+
+# Quantidade máxima de dígitos convertidos em um palpite. Como o número sorteado vai de 1 a 100,
+# palpites com mais dígitos recebem a mesma dica sem passar por int().
+MAX_DIGITOS_PALPITE = 3
+
+# Mensagens fixas do protocolo, já codificadas e terminadas em '\n', para que o envio
+# não precise codificá-las novamente a cada uso.
+MSG_NOME = "Digite seu nome de usuário: \n".encode()
+MSG_SERVIDOR_CHEIO = "Servidor cheio. Tente novamente mais tarde.\n".encode()
+MSG_NOME_EM_USO = "Nome de usuário já em uso.\n".encode()
+MSG_COMANDOS = "Comandos: /START, /SCORE, /END ou /DESCONECTAR\n".encode()
+MSG_COMANDO_INVALIDO = "Comando inválido!\nComandos: /START, /SCORE, /END ou /DESCONECTAR\n".encode()
+MSG_DESCONECTAR = b"/DESCONECTAR\n"
+MSG_JOGO_JA_INICIADO = "Jogo já iniciado!\n".encode()
+MSG_SEM_JOGO = "Nenhum jogo em andamento. Utilize /START ou aguarde alguém iniciar o jogo.\n".encode()
+MSG_SEM_JOGO_PARA_FINALIZAR = "Nenhum jogo em andamento para finalizar.\n".encode()
+MSG_MAIOR = "O número é maior.\n".encode()
+MSG_MENOR = "O número é menor.\n".encode()
+MSG_ENTRADA_INVALIDA = "Por favor, envie uma entrada válida (número inteiro).\n".encode()
+MSG_MENSAGEM_LONGA = f"Mensagem muito longa (máximo de {MAX_TAMANHO_MENSAGEM} bytes). Conexão encerrada.\n".encode()
 
 # Dicionário global para armazenar os jogadores conectados e seus dados.
 # Chave: nome do jogador, Valor: objeto ClientHandler associado ao jogador.
 jogadores = {}
 
+# Cópia imutável de jogadores.values(), republicada a cada entrada ou saída de jogador.
+# Os anúncios percorrem a tupla, então um jogador removido durante um envio com falha
+# não altera a coleção que está sendo percorrida.
+_players_snapshot = ()
+
+# Pontuações dos jogadores conectados, separadas dos objetos ClientHandler.
+# Chave: nome do jogador, Valor: pontuação. Nomes ausentes valem 0, então zerar
+# todas as pontuações é apenas limpar o contador.
+placar = Counter()
+
+# Último ranking montado, já codificado e pronto para envio. Volta a None sempre que uma pontuação muda
+# ou um jogador entra ou sai, forçando a montagem de um novo ranking.
+_ranking_cache = None
+
 # Variável global para indicar se o jogo está em andamento.
 jogo_comecou = False
 
 # Variável global que armazena o número a ser adivinhado.
 numero_para_adivinhar = 0
 
-# Lock global para controlar o acesso aos recursos compartilhados entre threads.
-lock = threading.Lock()
+# Descritor de arquivo mantido em reserva. Quando o processo esgota seus descritores, ele é
+# liberado para aceitar e fechar a conexão pendente, que de outra forma continuaria na fila
+# e faria o laço de eventos tentar aceitá-la sem parar.
+_descritor_reserva = None
+
+def _calcular_limite_conexoes():
+    """
+    Calcula quantos clientes podem ficar conectados ao mesmo tempo.
+
+    Usa MAX_CONEXOES, reduzido se o limite de descritores de arquivo do processo
+    (RLIMIT_NOFILE) for menor, para que accept() não falhe antes de o limite ser atingido.
+
+    Returns:
+        int: Número máximo de clientes conectados.
+    """
+    if resource is None:
+        return MAX_CONEXOES
+    limite_descritores, _ = resource.getrlimit(resource.RLIMIT_NOFILE)
+    if limite_descritores == resource.RLIM_INFINITY:
+        return MAX_CONEXOES
+    return max(1, min(MAX_CONEXOES, limite_descritores - DESCRITORES_RESERVADOS))
+
+def _abrir_descritor_reserva():
+    """
+    Abre o descritor de arquivo de reserva, se ainda não estiver aberto.
+    """
+    global _descritor_reserva
+    if _descritor_reserva is None:
+        try:
+            _descritor_reserva = open(os.devnull, 'rb')
+        except OSError:
+            pass  # Sem descritores livres agora; tenta novamente na próxima falha.
+
+def _descartar_conexao_pendente(server_socket):
+    """
+    Aceita e fecha imediatamente uma conexão pendente usando o descritor de reserva.
+
+    Args:
+        server_socket (socket.socket): Socket de escuta do servidor.
+    """
+    global _descritor_reserva
+    if _descritor_reserva is None:
+        return
+    _descritor_reserva.close()
+    _descritor_reserva = None
+    try:
+        client_socket, addr = server_socket.accept()
+        client_socket.close()
+        print(f"Conexão de {addr} recusada: sem descritores de arquivo disponíveis.")
+    except OSError:
+        pass
+    finally:
+        _abrir_descritor_reserva()
+
+def _publicar_jogadores():
+    """
+    Republica a cópia imutável dos jogadores conectados.
+
+    Deve ser chamada logo após alterar o dicionário jogadores.
+    """
+    global _players_snapshot, _ranking_cache
+    _players_snapshot = tuple(jogadores.values())
+    _ranking_cache = None  # O conjunto de jogadores mudou.
 
-class ClientHandler(threading.Thread):
+class ClientHandler:
     """
-    Classe que lida com cada cliente conectado ao servidor em uma thread separada.
+    Classe que guarda o estado de cada cliente conectado ao servidor.
+
+    Todos os clientes são atendidos pela mesma thread, no laço de eventos de start_server,
+    que chama handle_read sempre que há dados disponíveis na conexão e handle_write quando
+    a conexão volta a aceitar dados pendentes de envio.
 
     Atributos:
-        conn (socket.socket): Conexão com o cliente.
+        conn (socket.socket): Conexão (não bloqueante) com o cliente.
         addr (tuple): Endereço do cliente (host, porta).
+        seletor (selectors.BaseSelector): Seletor em que a conexão está registrada.
         nome (str): Nome do jogador.
-        score (int): Pontuação atual do jogador.
+        score (int): Pontuação atual do jogador, armazenada no placar global.
+        buffer (bytearray): Bytes recebidos que ainda não formam uma mensagem completa.
+        saida (bytearray): Bytes que o socket ainda não aceitou enviar.
+        conectado (bool): Indica se a conexão ainda está aberta.
     """
-    def __init__(self, conn, addr):
-        threading.Thread.__init__(self)
+    def __init__(self, conn, addr, seletor):
         self.conn = conn  # Conexão socket com o cliente.
         self.addr = addr  # Endereço (IP, porta) do cliente.
+        self.seletor = seletor  # Seletor do laço de eventos do servidor.
         self.nome = None  # Nome do jogador (será solicitado ao conectar).
-        self.score = 0  # Pontuação inicial do jogador.
+        # Cada mensagem do protocolo termina em '\n'; o buffer acumula os bytes recebidos
+        # até que uma mensagem esteja completa.
+        self.buffer = bytearray()
+        # Mensagens que não couberam no buffer do socket aguardam aqui, sem bloquear o laço
+        # de eventos nem os envios para os demais jogadores.
+        self.saida = bytearray()
+        self.conectado = True
 
-    def run(self):
+    @property
+    def score(self):
         """
-        Método principal da thread que é executado ao iniciar a conexão do cliente.
-        Responsável por interagir com o cliente, recebendo e enviando mensagens.
+        Pontuação atual do jogador, lida do placar global.
+        """
+        return placar[self.nome]
+
+    @score.setter
+    def score(self, valor):
+        placar[self.nome] = valor
+
+    def iniciar(self):
+        """
+        Inicia a interação com o cliente recém-conectado, solicitando o nome de usuário.
         """
-        global jogadores
         print(f"Conectado com {self.addr}")
-        with self.conn:
-            # Solicita o nome de usuário ao conectar.
-            self.enviar("Digite seu nome de usuário: ")
-            nome = self.conn.recv(1024).decode()
-
-            # Verifica se o nome de usuário já está em uso.
-            with lock:
-                if nome in jogadores:
-                    # Nome já em uso, envia mensagem de erro e encerra a conexão.
-                    self.enviar("Nome de usuário já em uso.")
-                    print(f"Conexão encerrada. Tentativa de conexão com nome de usuário já em uso: {nome} de {self.addr}")
-                    self.conn.close()
-                    return
-                else:
-                    # Nome válido, adiciona o jogador à lista.
-                    self.nome = nome  # Atribui o nome ao jogador.
-                    jogadores[nome] = self  # Adiciona o jogador ao dicionário global.
-                    self.anunciar(f"{nome} entrou no jogo!")  # Notifica todos os jogadores.
-                    self.enviar(f"Bem-vindo, {nome}!\nComandos: /START, /SCORE, /END ou /DESCONECTAR")
-                    print(f"Jogador {nome} conectado de {self.addr}")
+        self._send_bytes(MSG_NOME)
+
+    def handle_read(self):
+        """
+        Lê os dados disponíveis na conexão e processa cada mensagem completa recebida.
+        """
+        try:
+            dados = self.conn.recv(TAMANHO_LEITURA)
+        except BlockingIOError:
+            return  # Nada a ler por enquanto.
+        except ConnectionError:
+            dados = b''
+        if not dados:
+            # Fim do fluxo: o cliente fechou a conexão.
+            print(f"Cliente {self.addr} desconectou.")
+            self.encerrar()
+            return
+
+        # O que já estava no buffer não contém '\n'; procura apenas nos bytes recém-chegados.
+        inicio = len(self.buffer)
+        self.buffer += dados
+        while self.conectado:
+            fim = self.buffer.find(b'\n', inicio)
+            if fim < 0:
+                break  # Mensagem ainda incompleta; aguarda mais dados.
+            if fim > MAX_TAMANHO_MENSAGEM:
+                self.recusa_mensagem_longa()
+                return
+            linha = bytes(self.buffer[:fim])
+            del self.buffer[:fim + 1]
+            inicio = 0  # O restante do buffer veio todo desta leitura.
+            self.processa_mensagem(linha.decode('utf-8', 'replace').rstrip('\r'))
+
+        if self.conectado and len(self.buffer) > MAX_TAMANHO_MENSAGEM:
+            self.recusa_mensagem_longa()
+
+    def recusa_mensagem_longa(self):
+        """
+        Descarta os dados recebidos e desconecta o cliente que enviou uma mensagem acima
+        de MAX_TAMANHO_MENSAGEM bytes.
+        """
+        print(f"Cliente {self.addr} enviou uma mensagem acima de {MAX_TAMANHO_MENSAGEM} bytes. Encerrando conexão.")
+        self.buffer.clear()
+        self._send_bytes(MSG_MENSAGEM_LONGA)
+        self.encerrar()
+
+    def processa_mensagem(self, mensagem):
+        """
+        Processa uma mensagem completa recebida do cliente.
+
+        Args:
+            mensagem (str): Mensagem recebida, sem o '\n' final.
+        """
+        if self.nome is None:
+            # A primeira mensagem do cliente é o nome de usuário.
+            self.registra_jogador(mensagem)
+            return
+
+        mensagem = mensagem.strip()
+
+        if mensagem.startswith("/"):
+            # Comandos especiais iniciados com '/'; apenas eles são convertidos para maiúsculas.
+            comando = mensagem.upper()
+            if comando == "/DESCONECTAR":
+                # O cliente deseja desconectar.
+                self._send_bytes(MSG_DESCONECTAR)  # Envia comando de desconexão para o cliente.
+                self.encerrar()  # Remove o jogador e fecha a conexão.
+            else:
+                self.processa_comando(comando)
+        else:
+            # Processa tentativas de adivinhação (mensagens que não são comandos).
+            self.processar_adivinhacao(mensagem)
+
+    def registra_jogador(self, nome):
+        """
+        Registra o jogador com o nome informado, se ainda não estiver em uso.
+
+        Args:
+            nome (str): Nome de usuário enviado pelo cliente.
+        """
+        global jogadores
+        if nome in jogadores:
+            # Nome já em uso, envia mensagem de erro e encerra a conexão.
+            self._send_bytes(MSG_NOME_EM_USO)
+            print(f"Conexão encerrada. Tentativa de conexão com nome de usuário já em uso: {nome} de {self.addr}")
+            self.encerrar()
+            return
 
+        # Nome válido, adiciona o jogador à lista.
+        self.nome = nome  # Atribui o nome ao jogador.
+        jogadores[nome] = self  # Adiciona o jogador ao dicionário global.
+        _publicar_jogadores()
+        self.anunciar(f"{nome} entrou no jogo!")  # Notifica todos os jogadores.
+        self.enviar(f"Bem-vindo, {nome}!\nComandos: /START, /SCORE, /END ou /DESCONECTAR")
+        print(f"Jogador {nome} conectado de {self.addr}")
+
+    def encerrar(self):
+        """
+        Remove o jogador, retira a conexão do seletor e fecha o socket do cliente.
+        Pode ser chamado mais de uma vez; apenas a primeira chamada tem efeito.
+        """
+        if not self.conectado:
+            return
+        self.conectado = False
+        if self.saida:
             try:
-                while True:
-                    # Recebe a mensagem do cliente.
-                    mensagem = self.conn.recv(1024).decode().strip()
-
-                    # Verifica se o cliente deseja desconectar.
-                    if mensagem.upper() == "/DESCONECTAR":
-                        self.enviar("/DESCONECTAR")  # Envia comando de desconexão para o cliente.
-                        self.remove_jogador()  # Remove o jogador da lista global.
-                        break  # Sai do loop e encerra a thread.
-                    elif mensagem.startswith("/"):
-                        # Processa comandos especiais iniciados com '/'.
-                        self.processa_comando(mensagem.upper())
-                    else:
-                        # Processa tentativas de adivinhação (mensagens que não são comandos).
-                        self.processar_adivinhacao(mensagem)
-            except ConnectionError:
-                # Trata erros de conexão, como cliente desconectado abruptamente.
-                print(f"Cliente {self.addr} desconectou.")
-            except Exception as e:
-                print(f"Erro ao lidar com o cliente: {e}")
-            finally:
-                try:
-                    self.remove_jogador()  # Remove o jogador da lista global, se ainda estiver presente.
-                    self.conn.shutdown(socket.SHUT_RDWR)  # Fecha a conexão de maneira segura.
-                except Exception as e:
-                    print(f"Erro ao encerrar conexão com {self.addr}: {e}")
-                finally:
-                    self.conn.close()  # Fecha o socket do cliente.
-                    print(f"Conexão com {self.addr} encerrada.")
+                self.conn.send(self.saida)  # Última tentativa de entregar as mensagens pendentes.
+            except OSError:
+                pass
+        self.remove_jogador()  # Remove o jogador da lista global, se ainda estiver presente.
+        try:
+            self.seletor.unregister(self.conn)
+        except (KeyError, ValueError):
+            pass  # Conexão já removida do seletor.
+        try:
+            self.conn.shutdown(socket.SHUT_RDWR)  # Fecha a conexão de maneira segura.
+        except OSError:
+            pass  # O cliente já encerrou a conexão.
+        finally:
+            self.conn.close()  # Fecha o socket do cliente.
+            print(f"Conexão com {self.addr} encerrada.")
 
     def enviar(self, mensagem):
         """
@@ -98,54 +326,110 @@ class ClientHandler(threading.Thread):
         Args:
             mensagem (str): Mensagem a ser enviada.
         """
+        self._send_bytes(mensagem.encode() + b'\n')  # Envia a mensagem terminada em '\n'.
+
+    def _send_bytes(self, dados):
+        """
+        Envia ao cliente uma mensagem já codificada e terminada em '\n'.
+
+        O envio nunca bloqueia: o que o socket não aceitar de imediato fica em saida e é
+        enviado por handle_write quando a conexão estiver pronta.
+
+        Args:
+            dados (bytes): Mensagem codificada a ser enviada.
+        """
+        if not self.conectado:
+            return
+        if self.saida:
+            # Já há mensagens na fila; envia depois delas para preservar a ordem.
+            self.saida += dados
+            if len(self.saida) > MAX_SAIDA_PENDENTE:
+                print(f"Cliente {self.addr} não está recebendo as mensagens. Encerrando conexão.")
+                self.saida.clear()
+                self.encerrar()
+            return
+        try:
+            enviados = self.conn.send(dados)
+        except BlockingIOError:
+            enviados = 0  # Buffer do socket cheio.
+        except Exception as e:
+            print(f"Erro ao enviar mensagem para {self.nome}: {str(e)}")
+            self.encerrar()
+            return
+        if enviados < len(dados):
+            self.saida += dados[enviados:]
+            # Passa a ser notificado quando o socket puder receber mais dados.
+            self.seletor.modify(self.conn, selectors.EVENT_READ | selectors.EVENT_WRITE, self)
+
+    def handle_write(self):
+        """
+        Envia as mensagens pendentes assim que a conexão volta a aceitar dados.
+        """
+        if not self.conectado:
+            return  # Conexão encerrada por outro evento do mesmo select().
         try:
-            self.conn.send(mensagem.encode())  # Envia a mensagem codificada para o cliente.
+            enviados = self.conn.send(self.saida)
+        except BlockingIOError:
+            return
         except Exception as e:
             print(f"Erro ao enviar mensagem para {self.nome}: {str(e)}")
-            self.conn.close()
+            self.encerrar()
+            return
+        del self.saida[:enviados]
+        if not self.saida:
+            # Tudo enviado; volta a aguardar apenas mensagens do cliente.
+            self.seletor.modify(self.conn, selectors.EVENT_READ, self)
 
     def remove_jogador(self):
         """
         Remove o jogador da lista global de jogadores.
         """
         global jogadores
-        with lock:
-            if self.nome in jogadores:
-                del jogadores[self.nome]  # Remove o jogador do dicionário.
-                self.anunciar(f"{self.nome} saiu do jogo.")  # Notifica os demais jogadores.
+        if jogadores.get(self.nome) is self:
+            del jogadores[self.nome]  # Remove o jogador do dicionário.
+            placar.pop(self.nome, None)  # Um novo jogador com o mesmo nome começa do zero.
+            _publicar_jogadores()
+            self.anunciar(f"{self.nome} saiu do jogo.")  # Notifica os demais jogadores.
 
     def processa_comando(self, comando):
         """
         Processa os comandos enviados pelos jogadores.
 
         Args:
-            comando (str): Comando recebido do jogador.
-        """
-        if comando == "/START":
-            self.inicia_jogo()  # Inicia um novo jogo.
-        elif comando == "/SCORE":
-            str_rank = self.ranking()  # Obtém o ranking dos jogadores.
-            self.enviar(str_rank)  # Envia o ranking para o jogador.
-        elif comando == "/END":
-            self.finalizar_jogo()  # Finaliza o jogo em andamento.
-            self.zerar_scores()  # Zera as pontuações de todos os jogadores.
-            self.enviar("Comandos: /START, /SCORE, /END ou /DESCONECTAR")
+            comando (str): Comando recebido do jogador, em maiúsculas.
+        """
+        metodo = self.COMANDOS.get(comando)
+        if metodo is None:
+            self._send_bytes(MSG_COMANDO_INVALIDO)
         else:
-            self.enviar("Comando inválido!\nComandos: /START, /SCORE, /END ou /DESCONECTAR")
+            metodo(self)
+
+    def envia_ranking(self):
+        """
+        Envia o ranking atual somente para este jogador.
+        """
+        self._send_bytes(self.ranking())  # Envia o ranking para o jogador.
+
+    def encerra_partida(self):
+        """
+        Finaliza o jogo em andamento e zera as pontuações de todos os jogadores.
+        """
+        self.finalizar_jogo()  # Finaliza o jogo em andamento.
+        self.zerar_scores()  # Zera as pontuações de todos os jogadores.
+        self._send_bytes(MSG_COMANDOS)
 
     def inicia_jogo(self):
         """
         Inicia um novo jogo, gerando um número aleatório a ser adivinhado.
         """
         global jogo_comecou, numero_para_adivinhar
-        with lock:
-            if jogo_comecou:
-                self.enviar("Jogo já iniciado!")  # Informa que já existe um jogo em andamento.
-                return
-            numero_para_adivinhar = random.randint(1, 100)  # Gera um número aleatório entre 1 e 100.
-            jogo_comecou = True  # Marca que o jogo começou.
-            print(f"Novo número gerado: {numero_para_adivinhar}")
-            self.anunciar(f"Novo jogo iniciado! Tente adivinhar o número entre 1 e 100.")  # Notifica todos os jogadores.
+        if jogo_comecou:
+            self._send_bytes(MSG_JOGO_JA_INICIADO)  # Informa que já existe um jogo em andamento.
+            return
+        numero_para_adivinhar = random.randint(1, 100)  # Gera um número aleatório entre 1 e 100.
+        jogo_comecou = True  # Marca que o jogo começou.
+        print(f"Novo número gerado: {numero_para_adivinhar}")
+        self.anunciar(f"Novo jogo iniciado! Tente adivinhar o número entre 1 e 100.")  # Notifica todos os jogadores.
 
     def anunciar(self, mensagem):
         """
@@ -154,51 +438,55 @@ class ClientHandler(threading.Thread):
         Args:
             mensagem (str): Mensagem a ser anunciada.
         """
-        global jogadores
-        with lock:
-            for cliente in jogadores.values():
-                cliente.enviar(mensagem)
+        self._anunciar_bytes(mensagem.encode() + b'\n')  # Codifica uma única vez para todos.
+
+    def _anunciar_bytes(self, dados):
+        """
+        Envia uma mensagem já codificada e terminada em '\n' para todos os jogadores conectados.
+
+        Args:
+            dados (bytes): Mensagem codificada a ser anunciada.
+        """
+        for cliente in _players_snapshot:
+            cliente._send_bytes(dados)
 
     def ranking(self):
         """
         Retorna o ranking dos jogadores com base nas suas pontuações.
 
         Returns:
-            str: Uma string formatada com o ranking dos jogadores.
+            bytes: O ranking formatado, já codificado e terminado em '\n'.
         """
-        global jogadores
-        with lock:
-            # Ordena os jogadores pela pontuação (score) em ordem decrescente.
-            ranking = sorted(jogadores.values(), key=lambda jogador: jogador.score, reverse=True)
-            mensagem = "Ranking:\n"
-            posicao = 1
-            for jogador in ranking:
-                mensagem += f"{posicao}. {jogador.nome}: {jogador.score}\n"
-                posicao += 1
-            return mensagem
+        global _ranking_cache
+        if _ranking_cache is not None:
+            return _ranking_cache  # Nenhuma pontuação mudou desde o último ranking.
+        # Ordena os jogadores pela pontuação (score) em ordem decrescente.
+        ranking = sorted(_players_snapshot, key=lambda jogador: jogador.score, reverse=True)
+        linhas = "".join(
+            f"{posicao}. {jogador.nome}: {jogador.score}\n" for posicao, jogador in enumerate(ranking, 1)
+        )
+        _ranking_cache = ("Ranking:\n" + linhas + "\n").encode()
+        return _ranking_cache
 
     def finalizar_jogo(self):
         """
         Finaliza o jogo em andamento e anuncia o ranking.
         """
         global jogo_comecou
-        with lock:
-            if not jogo_comecou:
-                self.enviar("Nenhum jogo em andamento para finalizar.")  # Informa que não há jogo ativo.
-                return
-            self.anunciar(f"Jogo finalizado por: {self.nome}!")  # Notifica que o jogo foi finalizado.
-            jogo_comecou = False  # Marca que o jogo foi encerrado.
-            str_rank = self.ranking()  # Obtém o ranking.
-            self.anunciar(str_rank)  # Anuncia o ranking para todos os jogadores.
+        if not jogo_comecou:
+            self._send_bytes(MSG_SEM_JOGO_PARA_FINALIZAR)  # Informa que não há jogo ativo.
+            return
+        jogo_comecou = False  # Marca que o jogo foi encerrado.
+        self.anunciar(f"Jogo finalizado por: {self.nome}!")  # Notifica que o jogo foi finalizado.
+        self._anunciar_bytes(self.ranking())  # Anuncia o ranking para todos os jogadores.
 
     def zerar_scores(self):
         """
         Zera as pontuações de todos os jogadores.
         """
-        global jogadores
-        with lock:
-            for jogador in jogadores.values():
-                jogador.score = 0  # Reseta a pontuação do jogador.
+        global _ranking_cache
+        placar.clear()  # Jogadores ausentes do placar têm pontuação 0.
+        _ranking_cache = None
 
     def processar_adivinhacao(self, opcao):
         """
@@ -207,45 +495,117 @@ class ClientHandler(threading.Thread):
         Args:
             opcao (str): A tentativa de adivinhação do jogador (deve ser um número).
         """
-        global numero_para_adivinhar, jogo_comecou
-        try:
-            opcao = int(opcao)  # Converte a entrada em número inteiro.
-            if not jogo_comecou:
-                self.enviar("Nenhum jogo em andamento. Utilize /START ou aguarde alguém iniciar o jogo.")  # Informa que não há jogo ativo.
-            elif opcao == numero_para_adivinhar:
-                # Jogador acertou o número.
-                self.anunciar(f"{self.nome} acertou o número: {numero_para_adivinhar}!")  # Notifica todos os jogadores.
-                self.score += 1  # Incrementa a pontuação do jogador.
-                print(f"{self.nome} acertou o número: {numero_para_adivinhar}.")
-                self.finalizar_jogo()  # Finaliza o jogo após o acerto.
-                self.inicia_jogo()  # Inicia um novo jogo automaticamente.
-            elif opcao < numero_para_adivinhar:
-                self.enviar("O número é maior.")  # Dá uma dica ao jogador.
-            else:
-                self.enviar("O número é menor.")  # Dá uma dica ao jogador.
-        except ValueError:
+        global numero_para_adivinhar, jogo_comecou, _ranking_cache
+        # Valida a entrada antes da conversão, evitando o custo de tratar ValueError
+        # a cada mensagem digitada incorretamente. isdecimal aceita apenas dígitos que int() converte.
+        digitos = opcao[1:] if opcao[:1] in ("-", "+") else opcao
+        if not digitos.isdecimal():
             # Trata entradas que não são números inteiros.
-            self.enviar("Por favor, envie uma entrada válida (número inteiro).")
+            self._send_bytes(MSG_ENTRADA_INVALIDA)
+            return
+        digitos = digitos.lstrip("0") or "0"  # Zeros à esquerda também contam no limite de int().
+        if len(digitos) > MAX_DIGITOS_PALPITE:
+            # Fora do intervalo de 1 a 100: um valor também fora dele gera a mesma dica, sem
+            # converter números com dígitos demais para int().
+            valor = 10 ** MAX_DIGITOS_PALPITE
+        else:
+            valor = int(digitos)  # Converte a entrada em número inteiro.
+        opcao = -valor if opcao[:1] == "-" else valor
+        if not jogo_comecou:
+            self._send_bytes(MSG_SEM_JOGO)  # Informa que não há jogo ativo.
+        elif opcao == numero_para_adivinhar:
+            # Jogador acertou o número.
+            self.anunciar(f"{self.nome} acertou o número: {numero_para_adivinhar}!")  # Notifica todos os jogadores.
+            self.score += 1  # Incrementa a pontuação do jogador.
+            _ranking_cache = None  # O ranking precisa ser montado novamente.
+            print(f"{self.nome} acertou o número: {numero_para_adivinhar}.")
+            self.finalizar_jogo()  # Finaliza o jogo após o acerto.
+            self.inicia_jogo()  # Inicia um novo jogo automaticamente.
+        elif opcao < numero_para_adivinhar:
+            self._send_bytes(MSG_MAIOR)  # Dá uma dica ao jogador.
+        else:
+            self._send_bytes(MSG_MENOR)  # Dá uma dica ao jogador.
+
+    # Comandos aceitos pelo servidor e o método que trata cada um.
+    COMANDOS = {
+        "/START": inicia_jogo,
+        "/SCORE": envia_ranking,
+        "/END": encerra_partida,
+    }
+
+def aceitar_conexao(server_socket, seletor):
+    """
+    Aceita uma nova conexão e a registra no seletor para leitura.
+
+    Args:
+        server_socket (socket.socket): Socket de escuta do servidor.
+        seletor (selectors.BaseSelector): Seletor do laço de eventos.
+    """
+    try:
+        client_socket, addr = server_socket.accept()  # Aceita uma nova conexão.
+    except BlockingIOError:
+        return  # A conexão foi desfeita antes de ser aceita.
+    except OSError as e:
+        # Ex.: limite de descritores de arquivo esgotado; o servidor continua atendendo os demais.
+        print(f"Erro ao aceitar conexão: {e}")
+        if e.errno in (errno.EMFILE, errno.ENFILE):
+            _descartar_conexao_pendente(server_socket)
+        return
+    # O seletor contém o socket de escuta e um registro por cliente conectado.
+    limite = _calcular_limite_conexoes()
+    if len(seletor.get_map()) - 1 >= limite:
+        print(f"Conexão de {addr} recusada: limite de {limite} clientes atingido.")
+        with client_socket:
+            try:
+                client_socket.sendall(MSG_SERVIDOR_CHEIO)
+            except OSError:
+                pass  # O cliente já encerrou a conexão.
+        return
+    if TCP_NODELAY_ENABLED:
+        client_socket.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)  # Envia cada mensagem imediatamente.
+    client_socket.setblocking(False)
+    client_handler = ClientHandler(client_socket, addr, seletor)  # Cria um novo manipulador de cliente.
+    seletor.register(client_socket, selectors.EVENT_READ, client_handler)
+    client_handler.iniciar()
 
 def start_server(host='localhost', port=12345):
     """
-    Inicia o servidor e aguarda conexões dos clientes.
+    Inicia o servidor e atende todos os clientes em um único laço de eventos.
 
     Args:
         host (str, optional): Endereço do servidor. Padrão é 'localhost'.
         port (int, optional): Porta do servidor. Padrão é 12345.
     """
-    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server_socket:
+    with socket.socket(socket.AF_INET, socket.SOCK_STREAM) as server_socket, \
+            selectors.DefaultSelector() as seletor:
+        # Permite reiniciar o servidor na mesma porta sem esperar o fim do TIME_WAIT das conexões anteriores.
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_SNDBUF, TAMANHO_BUFFER_SOCKET)
+        server_socket.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, TAMANHO_BUFFER_SOCKET)
         server_socket.bind((host, port))  # Liga o socket ao host e porta fornecidos.
-        server_socket.listen()  # Coloca o socket em modo de escuta.
+        server_socket.listen(BACKLOG_CONEXOES)  # Coloca o socket em modo de escuta.
+        server_socket.setblocking(False)
+        # O socket de escuta é registrado sem dados associados; os clientes, com seu ClientHandler.
+        seletor.register(server_socket, selectors.EVENT_READ)
+        _abrir_descritor_reserva()
         print(f"Servidor iniciado em {host}: {port}.")
         print("Aguardando conexões...")
 
-        # Aceita conexões de novos clientes indefinidamente.
+        # Aguarda eventos de novas conexões e de mensagens dos clientes indefinidamente.
         while True:
-            client_socket, addr = server_socket.accept()  # Aceita uma nova conexão.
-            client_handler = ClientHandler(client_socket, addr)  # Cria um novo manipulador de cliente.
-            client_handler.start()  # Inicia a thread para lidar com o novo cliente.
+            for key, eventos in seletor.select():
+                if key.data is None:
+                    aceitar_conexao(server_socket, seletor)
+                    continue
+                client_handler = key.data
+                try:
+                    if eventos & selectors.EVENT_WRITE:
+                        client_handler.handle_write()
+                    if eventos & selectors.EVENT_READ and client_handler.conectado:
+                        client_handler.handle_read()
+                except Exception as e:
+                    print(f"Erro ao lidar com o cliente: {e}")
+                    client_handler.encerrar()
 
 if __name__ == "__main__":
-    start_server()  # Inicia o servidor.
\ No newline at end of file
+    start_server()  # Inicia o servidor.